@@ -28,13 +28,13 @@ class ProgressIndicator(Observer):  # pylint: disable=too-few-public-methods
         """Update the observer with the event."""
         match event.tag:
             case "monte_carlo_run_iteration":
+                # The simulation only sends these as often as we asked for
+                # them, which is every tenth of a percent. Each one also
+                # carries the iteration's end date, or None if it failed.
                 if current := event.data.get("number"):
-                    # We don't need total granularity here. We just want
-                    # to show progress to a tenth of a percent.
-                    if current % (NUMBER_OF_ITERATIONS / 1_000) == 0:
-                        percentage = current / self.total * 100
-                        print(f"Simulation: {percentage:.1f}% complete\r", end="")
-            case "monte_carlo_simulation_endgrep":
+                    percentage = current / self.total * 100
+                    print(f"Simulation: {percentage:.1f}% complete\r", end="")
+            case "monte_carlo_simulation_end":
                 print(
                     "Monte Simulation: 100% complete. Processing results...\r",
                     end="",
@@ -50,13 +50,8 @@ def main():
     file_directory = os.path.dirname(os.path.realpath(__file__))
     csv_file = os.path.join(file_directory, "assets", "fake-project.csv")
     with open(csv_file, encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        tasks = []
-        for row in reader:
-            row["optimistic"] = float(row["optimistic"])
-            row["pessimistic"] = float(row["pessimistic"])
-            row["likely"] = float(row["likely"])
-            tasks.append(Task(**row))
+        # The Task model converts the estimate columns to floats for us.
+        tasks = [Task(**row) for row in csv.DictReader(csvfile)]
     project = Project(
         name="This is an example project",
         tasks=tasks,
@@ -64,9 +59,20 @@ def main():
         work_hours_per_day=6.5,
         communication_penalty=0.5,
     )
-    monte = MonteCarlo(project, NUMBER_OF_ITERATIONS)
+    # We don't need total granularity here. We just want to show progress to
+    # a tenth of a percent.
+    monte = MonteCarlo(
+        project, NUMBER_OF_ITERATIONS, progress_interval=NUMBER_OF_ITERATIONS // 1_000
+    )
     progress = ProgressIndicator(NUMBER_OF_ITERATIONS)
-    monte.register_observer(progress)
+    monte.register_observer(
+        progress,
+        tags=(
+            "monte_carlo_run_iteration",
+            "monte_carlo_simulation_end",
+            "monte_carlo_processing_end",
+        ),
+    )
     results = monte.run()
 
     for day, result in results.items():
@@ -1,6 +1,7 @@
 """Abstract Base Classes for the Observer Pattern"""
 
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
 
 from software_project_estimator.event import Event
 
@@ -24,19 +25,48 @@ class Observable(ABC):
     """
 
     def __init__(self):
-        self._observers = []
+        self._observers: List[Observer] = []
+        # Observers that want every event, and observers indexed by the tags
+        # they asked for, so notifying only touches the interested ones.
+        self._all_tags_observers: List[Observer] = []
+        self._subscribers: Dict[str, List[Observer]] = {}
 
-    def register_observer(self, observer: Observer):
+    def register_observer(
+        self, observer: Observer, tags: Optional[Iterable[str]] = None
+    ):
         """
-        Register an observer
+        Register an observer. If tags are given the observer will only be
+        notified of events with one of those tags. Registering an observer
+        again adds to the tags it is notified of, and an observer is never
+        notified of the same event twice.
         """
-        self._observers.append(observer)
+        if observer not in self._observers:
+            self._observers.append(observer)
+        if observer in self._all_tags_observers:
+            return
+        if tags is None:
+            self._all_tags_observers.append(observer)
+            self._unsubscribe(observer)
+            return
+        for tag in set(tags):
+            observers = self._subscribers.setdefault(tag, [])
+            if observer not in observers:
+                observers.append(observer)
+
+    def is_observed(self, tag: str) -> bool:
+        """
+        Check whether any observer would be notified of an event with this
+        tag. Use this to avoid building events nobody will receive.
+        """
+        return bool(self._all_tags_observers or self._subscribers.get(tag))
 
     def notify_observers(self, event: Event):
         """
-        Notify all observers of an event
+        Notify the observers of an event
         """
-        for observer in self._observers:
+        for observer in self._all_tags_observers:
+            observer.update(event)
+        for observer in self._subscribers.get(event.tag, ()):
             observer.update(event)
 
     def unregister_observer(self, observer: Observer):
@@ -44,3 +74,17 @@ class Observable(ABC):
         Unregister an observer
         """
         self._observers.remove(observer)
+        if observer in self._all_tags_observers:
+            self._all_tags_observers.remove(observer)
+        self._unsubscribe(observer)
+
+    def _unsubscribe(self, observer: Observer):
+        """
+        Remove an observer from every tag it subscribed to
+        """
+        for tag in list(self._subscribers):
+            observers = self._subscribers[tag]
+            if observer in observers:
+                observers.remove(observer)
+            if not observers:
+                del self._subscribers[tag]
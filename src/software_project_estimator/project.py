@@ -4,10 +4,12 @@ can be set and a number of properties that can be read. Additionally, it can run
 the Monte Carlo simulation and return the results.
 """
 
+import functools
 from datetime import date, timedelta
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Tuple
 
 import holidays
+import numpy
 
 from pydantic import (  # pylint: disable=no-name-in-module # isort: skip
     BaseModel,
@@ -15,13 +17,47 @@ from pydantic import (  # pylint: disable=no-name-in-module # isort: skip
     validator,
 )
 
-from software_project_estimator.task import Task, TaskGroup  # isort: skip
+from software_project_estimator.task import (  # isort: skip
+    Task,
+    TaskGroup,
+    pert_estimates,
+)
 
 
 DAYS_IN_A_WEEK = 7
 WEEKS_IN_A_YEAR = 52
 
 
+@functools.lru_cache(maxsize=None)
+def _holidays_for(country_code: str, year: int) -> FrozenSet[date]:
+    """
+    Returns the holiday dates for a country in a year. These are cached for
+    the whole process so every project, and every copy of a project sent to
+    a worker, only loads them once.
+    """
+    try:
+        return frozenset(holidays.country_holidays(country_code, years=[year]))
+    except NotImplementedError as err:
+        raise ValueError(f"Unsupported country code: {country_code}") from err
+
+
+# Every iteration of a simulation walks the same weeks, so the holidays in a
+# week are only worked out once. Unlike the holiday years, the weeks a process
+# can ask about are unbounded, so only the most recent ones are kept.
+@functools.lru_cache(maxsize=1024)
+def _holiday_mask_for_week(country_code: str, start_date: date) -> int:
+    """
+    Returns the holidays in the week starting on start_date as a bitmask with
+    one bit per weekday (Monday is bit 0).
+    """
+    holiday_mask = 0
+    for day in range(DAYS_IN_A_WEEK):
+        this_date = start_date + timedelta(days=day)
+        if this_date in _holidays_for(country_code, this_date.year):
+            holiday_mask |= 1 << this_date.weekday()
+    return holiday_mask
+
+
 class Project(BaseModel):  # pylint: disable=too-many-instance-attributes
     """
     A software project. This is the main data model for the package. It
@@ -38,7 +74,7 @@ class Project(BaseModel):  # pylint: disable=too-many-instance-attributes
 
     name: str = Field(description="The name of the project")
     start_date: date = Field(
-        default=date.today(),
+        default_factory=date.today,
         description="The start date of the project",
     )
     developer_count: int = Field(
@@ -86,7 +122,6 @@ class Project(BaseModel):  # pylint: disable=too-many-instance-attributes
         default=[],
         description="The task groups in the project",
     )
-    _work_holidays: dict = {}
 
     @validator("developer_count")
     def _validate_developer_count(  # pylint: disable=no-self-argument
@@ -162,6 +197,17 @@ class Project(BaseModel):  # pylint: disable=too-many-instance-attributes
         """Returns the number of work days per week."""
         return len(self.weekly_work_days)
 
+    @property
+    def weekly_work_day_mask(self) -> int:
+        """
+        Returns the weekly work days as a bitmask with one bit per weekday
+        (Monday is bit 0), the same layout as the weekly holiday masks.
+        """
+        work_day_mask = 0
+        for day in self.weekly_work_days:
+            work_day_mask |= 1 << day
+        return work_day_mask
+
     @property
     def work_week_hours(self) -> float:
         """The number of work hours per week."""
@@ -187,35 +233,41 @@ class Project(BaseModel):  # pylint: disable=too-many-instance-attributes
         )
         return (base_hours - communication_hours) / self.work_hours_per_day
 
+    def task_estimates(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the averages and standard deviations of every task in the
+        project, including the tasks in task groups, as two float64 arrays.
+        """
+        tasks = [task for task_group in self.task_groups for task in task_group.tasks]
+        tasks.extend(self.tasks)
+        return pert_estimates(tasks)
+
     def is_holiday(self, this_date: date) -> bool:
         """Returns True if this_date is a holiday."""
         if self.country_code is None:
             return False
-        try:
-            holidays_this_year = self._work_holidays[this_date.year]
-        except KeyError:
-            try:
-                holidays_this_year = holidays.country_holidays(
-                    self.country_code, years=[this_date.year]
-                )
-            except NotImplementedError as err:
-                raise ValueError(
-                    f"Unsupported country code: {self.country_code}"
-                ) from err
-            self._work_holidays[this_date.year] = holidays_this_year
-        return this_date in holidays_this_year
+        return this_date in _holidays_for(self.country_code, this_date.year)
 
     def person_days_lost_to_holidays_this_week(self, start_date: Optional[date]) -> int:
         """Returns the number of person days lost to holidays this week."""
-        if start_date is None:
+        if start_date is None or self.country_code is None:
             return 0
-        days_lost = 0
-        current_date = start_date
-        for _day in range(DAYS_IN_A_WEEK):
-            if self.is_holiday(current_date):
-                days_lost += self.developer_count
-            current_date += timedelta(days=1)
-        return days_lost
+        holiday_mask = _holiday_mask_for_week(self.country_code, start_date)
+        return bin(holiday_mask).count("1") * self.developer_count
+
+    def working_day_count_this_week(self, start_date: date) -> int:
+        """Returns the number of days this week that are work days."""
+        holiday_mask = self._holiday_mask_this_week(start_date)
+        return bin(self.weekly_work_day_mask & ~holiday_mask).count("1")
+
+    def _holiday_mask_this_week(self, start_date: date) -> int:
+        """
+        Returns a bitmask of the holidays in the week starting on start_date,
+        with one bit per weekday.
+        """
+        if self.country_code is None:
+            return 0
+        return _holiday_mask_for_week(self.country_code, start_date)
 
     def working_days_this_week(self, start_date: date) -> list:
         """Returns all the days this week that are work days."""
@@ -6,7 +6,7 @@ https://refactoring.guru/design-patterns/state.
 
 import datetime
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import numpy
 
@@ -22,6 +22,22 @@ logger = logging.getLogger(__name__)
 
 
 WEEKS_IN_A_YEAR = 52
+# The weekly vacation losses are drawn this many weeks at a time and handed
+# out one week at a time, which is much cheaper than a numpy call per week.
+VACATION_BUFFER_SIZE = 16
+
+# The random generator used by iterations that aren't given one. Simulations
+# give each shard its own generator so that workers draw independent streams.
+_default_rng = numpy.random.default_rng()
+
+
+def project_estimate_distribution(project: Project) -> Tuple[float, float]:
+    """
+    Returns the mean and standard deviation of the sum of all the task
+    estimates in the project.
+    """
+    averages, stddevs = project.task_estimates()
+    return float(averages.sum()), float(numpy.sqrt(numpy.square(stddevs).sum()))
 
 
 class Iteration:
@@ -31,9 +47,23 @@ class Iteration:
     iteration is complete. To complete the iteration, call self.run().
     """
 
-    def __init__(self, project: Project) -> None:
+    def __init__(
+        self,
+        project: Project,
+        estimate_distribution: Optional[Tuple[float, float]] = None,
+        rng: Optional[numpy.random.Generator] = None,
+        estimated_person_days: Optional[float] = None,
+    ) -> None:
         self.context = IterationContext()
         self.context.project = project
+        # Simulations pass in the project's estimate distribution so that it
+        # is only gathered from the tasks once rather than every iteration.
+        self.context.estimate_distribution = estimate_distribution
+        # They can also pass in the estimate itself when they have drawn a
+        # batch of them ahead of time.
+        self.context.estimated_person_days = estimated_person_days
+        if rng is not None:
+            self.context.rng = rng
 
     @property
     def result(self) -> Optional[IterationResult]:
@@ -42,30 +72,70 @@ class Iteration:
 
     def run(self) -> None:
         """Run the iteration."""
-        self.context.transition_to(IterationStateUninitialized())
-        while self.context.result is None:
-            self.context.process()
+        context = self.context
+        process = context.process
+        context.transition_to(IterationStateUninitialized())
+        while context.result is None:
+            process()
 
 
-class IterationContext:
+class IterationContext:  # pylint: disable=too-many-instance-attributes
     """
     The IterationContext defines the interface for running a full iteration.
     """
 
-    project: Optional[Project] = None
-    person_days_remaining: Optional[float] = None
-    remainder_days: float = 0.0
-    working_days_left: Optional[float] = None
-    result: Optional[IterationResult] = None
-    current_date: Optional[datetime.date] = None
-
-    # This is the temporary result of the iteration. It is used to store what
-    # we think is the result of the iteration until we formatlize it by setting
-    # self.result.
-    provisional_result: Optional[IterationResult] = None
-
-    # This is the internal state of the context
-    _state: Optional[IterationBaseState] = None
+    # The context is created for every iteration, so it uses slots rather
+    # than an instance dictionary.
+    __slots__ = (
+        "project",
+        "person_days_remaining",
+        "remainder_days",
+        "working_days_left",
+        "result",
+        "current_date",
+        "estimate_distribution",
+        "estimated_person_days",
+        "rng",
+        "provisional_result",
+        "_state",
+        "_vacation_days",
+        "_vacation_parameters",
+    )
+
+    def __init__(self) -> None:
+        self.project: Optional[Project] = None
+        self.person_days_remaining: Optional[float] = None
+        self.remainder_days: float = 0.0
+        self.working_days_left: Optional[float] = None
+        self.result: Optional[IterationResult] = None
+        self.current_date: Optional[datetime.date] = None
+
+        # The mean and standard deviation of the whole project's estimate. The
+        # sum of independent normally distributed task estimates is itself
+        # normally distributed, so these are gathered once and each estimate is
+        # one draw.
+        self.estimate_distribution: Optional[Tuple[float, float]] = None
+
+        # An estimate of the project person days drawn ahead of time. The
+        # iteration draws its own when this is None.
+        self.estimated_person_days: Optional[float] = None
+
+        # The random generator that every probabilistic value is drawn from.
+        self.rng: numpy.random.Generator = _default_rng
+
+        # This is the temporary result of the iteration. It is used to store
+        # what we think is the result of the iteration until we formatlize it
+        # by setting self.result.
+        self.provisional_result: Optional[IterationResult] = None
+
+        # This is the internal state of the context
+        self._state: Optional[IterationBaseState] = None
+
+        # Vacation losses drawn ahead of time, along with the developer count,
+        # weeks off per year and work days per week they were drawn for, so
+        # that changes to the project aren't answered with stale draws.
+        self._vacation_days: List[int] = []
+        self._vacation_parameters: Optional[Tuple[int, float, int]] = None
 
     def transition_to(self, state: IterationBaseState):
         """
@@ -84,16 +154,44 @@ class IterationContext:
     def probabilistic_weekly_person_days_lost_to_vacations(self) -> int:
         """
         Returns a probabilistic number of person days theoretically lost to
-        vacations within a theoretical week.
+        vacations within a theoretical week. Each developer is on vacation with
+        a probability of weeks_off_per_year / WEEKS_IN_A_YEAR, so the number of
+        developers away is a binomial draw. The draws are made
+        VACATION_BUFFER_SIZE weeks at a time and handed out one by one.
         """
-        if not self.project or self.project.weeks_off_per_year <= 0:
+        project = self.project
+        if not project or project.weeks_off_per_year <= 0:
             return 0
-        days = 0.0
-        for _index in range(self.project.developer_count):
-            maximum = WEEKS_IN_A_YEAR / self.project.weeks_off_per_year
-            if numpy.random.uniform(0.0, maximum) <= 1.0:
-                days += self.project.work_days_per_week
-        return int(days)
+        parameters = (
+            project.developer_count,
+            project.weeks_off_per_year,
+            project.work_days_per_week,
+        )
+        if not self._vacation_days or parameters != self._vacation_parameters:
+            self._vacation_days = (
+                self.probabilistic_weekly_person_days_lost_to_vacations_batch(
+                    VACATION_BUFFER_SIZE
+                ).tolist()
+            )
+            self._vacation_parameters = parameters
+        return self._vacation_days.pop()
+
+    def probabilistic_weekly_person_days_lost_to_vacations_batch(
+        self, weeks: int
+    ) -> numpy.ndarray:
+        """
+        Returns an array of probabilistic numbers of person days lost to
+        vacations, one for each of `weeks` theoretical weeks, drawn in a single
+        call. Each developer is on vacation in a given week with a probability
+        of weeks_off_per_year / WEEKS_IN_A_YEAR.
+        """
+        if not self.project or self.project.weeks_off_per_year <= 0:
+            return numpy.zeros(weeks, dtype=int)
+        probability = self.project.weeks_off_per_year / WEEKS_IN_A_YEAR
+        developers_away = self.rng.binomial(
+            self.project.developer_count, probability, size=weeks
+        )
+        return developers_away * self.project.work_days_per_week
 
     def probabilistic_estimated_project_person_days(self) -> float:
         """
@@ -101,14 +199,30 @@ class IterationContext:
         is based on the probability distribution of the project's tasks and is
         useful in aggregating the results of multiple simulations.
         """
-        days = 0.0
         if not self.project:
-            return days
-        for task_group in self.project.task_groups:
-            for task in task_group.tasks:
-                days += numpy.random.normal(task.average, task.stddev)
+            return 0.0
+        mean, stddev = self._estimate_distribution()
+        return float(self.rng.normal(mean, stddev))
 
-        for task in self.project.tasks:
-            days += numpy.random.normal(task.average, task.stddev)
+    def probabilistic_estimated_project_person_days_batch(
+        self, size: int
+    ) -> numpy.ndarray:
+        """
+        Returns an array of `size` probabilistic numbers of estimated project
+        person days, drawn in a single call.
+        """
+        if not self.project:
+            return numpy.zeros(size)
+        mean, stddev = self._estimate_distribution()
+        return self.rng.normal(mean, stddev, size=size)
 
-        return days
+    def _estimate_distribution(self) -> Tuple[float, float]:
+        """
+        Returns the mean and standard deviation of the sum of all the task
+        estimates in the project.
+        """
+        if self.estimate_distribution is None:
+            self.estimate_distribution = project_estimate_distribution(
+                self.project  # type: ignore
+            )
+        return self.estimate_distribution
@@ -1,10 +1,9 @@
 """This module contains the models used by the simulation package."""
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel  # pylint: disable=no-name-in-module
-
 
 class IterationResultStatus(str, Enum):
     """The status of the iteration result."""
@@ -13,7 +12,8 @@ class IterationResultStatus(str, Enum):
     FAILURE = "failure"
 
 
-class IterationResult(BaseModel):  # pylint: disable=too-few-public-methods
+@dataclass
+class IterationResult:  # pylint: disable=too-few-public-methods
     """The result of an iteration."""
 
     status: IterationResultStatus
@@ -1,11 +1,14 @@
 """This manages all the monte carlo simulation for the project estimator."""
 
 
+import math
 import multiprocessing
-from datetime import datetime
-from typing import Optional
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel  # pylint: disable=no-name-in-module
+import numpy
 
 from software_project_estimator import Project
 from software_project_estimator.event import Event
@@ -15,25 +18,148 @@ from software_project_estimator.simulation.models import IterationResultStatus
 from software_project_estimator.simulation.iteration import (  # isort: skip
     Iteration,
     IterationResult,
+    project_estimate_distribution,
 )
 
+# The iterations are split into shards of this many iterations. Each shard is
+# run by a single worker with its own random stream, so smaller shards mean
+# smoother progress reporting and better load balancing at the cost of more
+# pickling. The size doesn't depend on the number of processes, so a seeded
+# simulation gives the same results on any machine.
+SHARD_SIZE = 100
+# Shards report the end date of each iteration as an ordinal, and this marks
+# an iteration that failed.
+FAILED_ITERATION = -1
 
-class MonteCarloOutcome(BaseModel):  # pylint: disable=too-few-public-methods
+# The project being simulated by this worker process. These are set by
+# _init_worker when the pool starts the worker.
+# pylint: disable=invalid-name
+_worker_project: Optional[Project] = None
+_worker_distribution: Optional[Tuple[float, float]] = None
+# pylint: enable=invalid-name
+
+
+def _run_iteration(
+    project: Project,
+    distribution: Optional[Tuple[float, float]] = None,
+    rng: Optional[numpy.random.Generator] = None,
+    estimated_person_days: Optional[float] = None,
+) -> Optional[IterationResult]:
+    """Run a single iteration of the monte carlo simulation."""
+    iteration = Iteration(
+        project,
+        estimate_distribution=distribution,
+        rng=rng,
+        estimated_person_days=estimated_person_days,
+    )
+    iteration.run()
+    return iteration.result
+
+
+def _process_count() -> int:
+    """
+    Return the number of processes to simulate with. This is the number of
+    CPUs this process may run on, which can be fewer than the machine has in
+    containers or under taskset.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
+
+
+def _init_worker(project: Optional[Project]) -> None:
+    """
+    Set up a worker process for the simulation. The project and its estimate
+    distribution don't change during a run, so they are handed to each worker
+    once here rather than pickled with every shard. A missing or invalid
+    project is left for the shards to report as failed iterations, since an
+    exception here would only make the pool start the worker again.
+    """
+    global _worker_project, _worker_distribution  # pylint: disable=global-statement
+    if not isinstance(project, Project):
+        _worker_project = None
+        _worker_distribution = None
+        return
+    _worker_project = project
+    _worker_distribution = project_estimate_distribution(project)
+
+
+def _run_shard(shard: Tuple[int, numpy.random.SeedSequence]) -> numpy.ndarray:
+    """
+    Run a shard of iterations of the monte carlo simulation on the worker's
+    project. This lives at the module level so that the pool only has to
+    pickle the shard's size and seed and not the simulation along with all of
+    its observers. Returns the end date of each iteration as an ordinal, or
+    FAILED_ITERATION if it failed, which is far cheaper to send back to the
+    parent than the results themselves.
+    """
+    size, seed_sequence = shard
+    # Forked workers all inherit the same random state from the parent, so
+    # every shard draws from its own PCG64 generator seeded independently.
+    rng = numpy.random.default_rng(seed_sequence)
+    end_dates = numpy.full(size, FAILED_ITERATION, dtype=numpy.int64)
+    project = _worker_project
+    if project is None:
+        # The pool's initializer hasn't run, so every iteration fails.
+        return end_dates
+    # Every iteration in the shard draws its estimate from the same
+    # distribution, so they are all drawn in one call up front.
+    estimates = Iteration(
+        project, estimate_distribution=_worker_distribution, rng=rng
+    ).context.probabilistic_estimated_project_person_days_batch(size)
+    for index, estimate in enumerate(estimates.tolist()):
+        result = _run_iteration(project, _worker_distribution, rng, estimate)
+        if (
+            result
+            and result.status == IterationResultStatus.SUCCESS
+            and result.attributes
+        ):
+            end_dates[index] = result.attributes["end_date"].toordinal()
+    return end_dates
+
+
+def _end_date(ordinal: int) -> Optional[date]:
+    """Return the end date for an ordinal from a shard."""
+    if ordinal == FAILED_ITERATION:
+        return None
+    return date.fromordinal(ordinal)
+
+
+@dataclass
+class MonteCarloOutcome:  # pylint: disable=too-few-public-methods
     """This class represents the outcome of a monte carlo simulation."""
 
     total: int
     probability: float
 
+    def __str__(self) -> str:
+        """Return the outcome in the format the README's example prints."""
+        return f"total={self.total!r} probability={self.probability!r}"
+
 
 class MonteCarlo(Observable):  # pylint: disable=too-few-public-methods
     """
     This class manages the monte carlo simulation for the project estimator.
     """
 
-    def __init__(self, project: Project, iterations: int):
-        """Initialize the monte carlo simulation."""
+    def __init__(
+        self,
+        project: Project,
+        iterations: int,
+        progress_interval: int = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the monte carlo simulation. Observers are notified of every
+        `progress_interval`th iteration that completes. Passing a seed makes
+        the results reproducible.
+        """
+        if progress_interval < 1:
+            raise ValueError("The progress interval must be 1 or greater")
         self.project = project
         self.iterations = iterations
+        self.progress_interval = progress_interval
+        self.seed = seed
         super().__init__()
 
     def run(self) -> dict:
@@ -56,18 +182,32 @@ class MonteCarlo(Observable):  # pylint: disable=too-few-public-methods
             self.notify_observers(Event(tag="monte_carlo_error", data={"message": msg}))
             raise RuntimeError(msg)
 
-        with multiprocessing.Pool() as pool:
-            results = []
-            for i, result in enumerate(
-                pool.imap_unordered(self._run_iteration, range(self.iterations))
-            ):
-                results.append(result)
-                self.notify_observers(
-                    Event(
-                        tag="monte_carlo_run_iteration",
-                        data={"number": i, "result": result},
-                    )
-                )
+        with multiprocessing.Pool(
+            processes=_process_count(),
+            initializer=_init_worker,
+            initargs=(self.project,),
+        ) as pool:
+            shards: List[numpy.ndarray] = []
+            count = 0
+            for end_dates in pool.imap_unordered(_run_shard, self._shards()):
+                shards.append(end_dates)
+                # Only build the events when somebody will receive them
+                if self.is_observed("monte_carlo_run_iteration"):
+                    first = -count % self.progress_interval
+                    for index in range(first, len(end_dates), self.progress_interval):
+                        self.notify_observers(
+                            Event(
+                                tag="monte_carlo_run_iteration",
+                                data={
+                                    "number": count + index,
+                                    "end_date": _end_date(end_dates[index]),
+                                },
+                            )
+                        )
+                count += len(end_dates)
+        results = (
+            numpy.concatenate(shards) if shards else numpy.array([], dtype=numpy.int64)
+        )
         end_time = datetime.now()
         self.notify_observers(
             Event(
@@ -79,28 +219,44 @@ class MonteCarlo(Observable):  # pylint: disable=too-few-public-methods
 
     def _run_iteration(self, _) -> Optional[IterationResult]:
         """Run a single iteration of the monte carlo simulation."""
-        iteration = Iteration(self.project)
-        iteration.run()
-        return iteration.result
+        return _run_iteration(self.project)
 
-    def _process_results(self, results: list) -> dict:
+    def _shards(self) -> List[Tuple[int, numpy.random.SeedSequence]]:
         """
-        Process the results by iterating through the list of results and
-        aggregating the data.
+        Split the iterations into shards for the worker processes. Each shard
+        gets its own child of the simulation's seed sequence.
+        """
+        shard_count = math.ceil(self.iterations / SHARD_SIZE)
+        if shard_count <= 0:
+            return []
+        size, remainder = divmod(self.iterations, shard_count)
+        seed_sequences = numpy.random.SeedSequence(self.seed).spawn(shard_count)
+        return [
+            (size + (1 if index < remainder else 0), seed_sequence)
+            for index, seed_sequence in enumerate(seed_sequences)
+        ]
+
+    def _process_results(self, results: numpy.ndarray) -> dict:
+        """
+        Process the results by tallying the end date ordinals from the shards
+        and aggregating the data.
         """
         self.notify_observers(Event(tag="monte_carlo_processing_start", data={}))
         start_time = datetime.now()
-        data: dict = {}
-        for result in results:
-            if result and result.status == IterationResultStatus.SUCCESS:
-                end_date = result.attributes.get("end_date")
-                if end_date not in data:
-                    data[end_date] = 1
-                else:
-                    data[end_date] += 1
+        end_dates = results[results != FAILED_ITERATION]
+        if self.is_observed("monte_carlo_result_prcessed"):
+            for ordinal in end_dates.tolist():
                 self.notify_observers(
-                    Event(tag="monte_carlo_result_prcessed", data={"result": result})
+                    Event(
+                        tag="monte_carlo_result_prcessed",
+                        data={"end_date": date.fromordinal(ordinal)},
+                    )
                 )
+        # Counting the ordinals into bins from the earliest end date gives the
+        # totals already in date order.
+        first_ordinal = int(end_dates.min()) if end_dates.size else 0
+        totals = numpy.bincount(end_dates - first_ordinal)
+        cumulative_totals = numpy.cumsum(totals)
         self.notify_observers(
             Event(
                 tag="monte_carlo_processing_end",
@@ -111,18 +267,19 @@ class MonteCarlo(Observable):  # pylint: disable=too-few-public-methods
         start_time = datetime.now()
         self.notify_observers(Event(tag="monte_carlo_outcomes_start", data={}))
         outcomes: dict = {}
-        cumulative_count = 0
-        for end_date, count in sorted(data.items()):
-            cumulative_count += count
+        for offset in numpy.flatnonzero(totals).tolist():
+            end_date = date.fromordinal(first_ordinal + offset)
             outcomes[end_date] = MonteCarloOutcome(
-                total=count, probability=cumulative_count / self.iterations
+                total=int(totals[offset]),
+                probability=int(cumulative_totals[offset]) / self.iterations,
             )
-            self.notify_observers(
-                Event(
-                    tag="monte_carlo_outcome_created",
-                    data={"outcome": outcomes[end_date]},
+            if self.is_observed("monte_carlo_outcome_created"):
+                self.notify_observers(
+                    Event(
+                        tag="monte_carlo_outcome_created",
+                        data={"outcome": outcomes[end_date]},
+                    )
                 )
-            )
         self.notify_observers(
             Event(
                 tag="monte_carlo_outcomes_end",
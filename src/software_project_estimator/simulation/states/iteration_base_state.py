@@ -17,6 +17,10 @@ class IterationBaseState(ABC):
     transition the Context to another State.
     """
 
+    # A new state is created on every transition, so states use slots rather
+    # than an instance dictionary. Subclasses should declare empty slots.
+    __slots__ = ("_context",)
+
     @property
     def context(
         self,
@@ -16,27 +16,34 @@ class IterationStateCalculatingDays(states.IterationBaseState):
     iteration.
     """
 
+    __slots__ = ()
+
     def handle_process(self) -> None:
         """
         Calculate the number of days in the iteration once the weeks have been
-        calculated.
+        calculated. The days are walked in a single tight loop, using local
+        variables, until the last working day has been used up.
         """
 
-        if self.context.project is None:
-            self.context.provisional_result = IterationResult(
+        context = self.context
+        project = context.project
+        if project is None:
+            context.provisional_result = IterationResult(
                 status=IterationResultStatus.FAILURE,
                 message="No project was provided.",
             )
-            self.context.transition_to(states.IterationStateError())
+            context.transition_to(states.IterationStateError())
             return
-        if self.context.current_date is None:
-            self.context.provisional_result = IterationResult(
+        current_date = context.current_date
+        if current_date is None:
+            context.provisional_result = IterationResult(
                 status=IterationResultStatus.FAILURE,
                 message="No current date was provided.",
             )
-            self.context.transition_to(states.IterationStateError())
+            context.transition_to(states.IterationStateError())
             return
-        self.context.person_days_remaining = self.context.person_days_remaining or 0
+        person_days_remaining = context.person_days_remaining or 0
+        context.person_days_remaining = person_days_remaining
         # The person days remaining are the number of person days left from the
         # estimated person days for the project after we've subtracted off all
         # the whole weeks. Remainder days is the remainder of the probablistic
@@ -44,30 +51,31 @@ class IterationStateCalculatingDays(states.IterationBaseState):
         # remaining to the remainder days is the portion of the week that we
         # need to completed. By multiplying that by the number of work days in
         # a week, we get the number of working (calendar) days left in the
-        # week. We only need to caluculate this the first time we're in this
-        # state.
-        if self.context.working_days_left is None:
-            num_working_days = len(
-                self.context.project.working_days_this_week(self.context.current_date)
-            )
-            portion_of_week = (
-                self.context.person_days_remaining / self.context.remainder_days
-            )
-            self.context.working_days_left = portion_of_week * num_working_days
+        # week.
+        working_days_left = context.working_days_left
+        if working_days_left is None:
+            num_working_days = project.working_day_count_this_week(current_date)
+            portion_of_week = person_days_remaining / context.remainder_days
+            working_days_left = portion_of_week * num_working_days
 
-        # Lets consider the day we're on today. If it's a holiday or a weekend,
-        # we need to skip it. If it's a working day, we need to decrement the
-        # working days left by one. If we've reached zero working days left,
-        # we need to transition to the finalizing state.
+        # Lets consider each day in turn. If it's a holiday or a weekend, we
+        # skip it. If it's a working day, we decrement the working days left by
+        # one. Once we've reached zero working days left, we move on to the
+        # finalizing state.
+        work_day_mask = project.weekly_work_day_mask
+        is_holiday = project.is_holiday
+        one_day = datetime.timedelta(days=1)
+        while True:
+            if (work_day_mask >> current_date.weekday()) & 1 and not is_holiday(
+                current_date
+            ):
+                working_days_left -= 1
+                current_date += one_day
+                if working_days_left <= 0:
+                    break
+            else:
+                current_date += one_day
 
-        if (
-            self.context.current_date.weekday()
-            not in self.context.project.weekly_work_days
-            or self.context.project.is_holiday(self.context.current_date)
-        ):
-            self.context.current_date += datetime.timedelta(days=1)
-        else:
-            self.context.working_days_left -= 1
-            self.context.current_date += datetime.timedelta(days=1)
-            if self.context.working_days_left <= 0:
-                self.context.transition_to(states.IterationStateFinalizing())
+        context.current_date = current_date
+        context.working_days_left = working_days_left
+        context.transition_to(states.IterationStateFinalizing())
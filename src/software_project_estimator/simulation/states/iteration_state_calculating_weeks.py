@@ -16,47 +16,43 @@ class IterationStateCalculatingWeeks(states.IterationBaseState):
     iteration.
     """
 
-    def handle_process(self) -> None:
-        """Calculate the number of whole weeks in the iteration."""
+    __slots__ = ()
 
-        if self.context.project is None:
-            self.context.provisional_result = IterationResult(
+    def handle_process(self) -> None:
+        """
+        Calculate the number of whole weeks in the iteration. The weeks are
+        consumed in a single tight loop, using local variables, until the
+        person days remaining fit within a week.
+        """
+
+        context = self.context
+        project = context.project
+        if project is None:
+            context.provisional_result = IterationResult(
                 status=IterationResultStatus.FAILURE,
                 message="No project was provided.",
             )
-            self.context.transition_to(states.IterationStateError())
+            context.transition_to(states.IterationStateError())
             return
 
-        current_date = self.context.current_date
-        maximum_weekly_days = self.context.project.max_person_days_per_week
-        vacation_days = (
-            self.context.probabilistic_weekly_person_days_lost_to_vacations()
-        )
-        holiday_days = self.context.project.person_days_lost_to_holidays_this_week(
-            current_date
-        )
-        probabilistic_person_days_this_week = (
-            maximum_weekly_days - vacation_days - holiday_days
-        )
-        probabilistic_person_days_this_week = (
-            0
-            if probabilistic_person_days_this_week < 0
-            else probabilistic_person_days_this_week
-        )
-        if (
-            self.context.person_days_remaining is not None
-            and self.context.person_days_remaining
-            <= probabilistic_person_days_this_week
-        ):
-            # It's now days, not weeks
-            self.context.remainder_days = probabilistic_person_days_this_week
-            self.context.transition_to(states.IterationStateCalculatingDays())
-            return
-
-        self.context.current_date = (
-            current_date + datetime.timedelta(weeks=1)
-            if current_date is not None
-            else self.context.current_date
-        )
-        if self.context.person_days_remaining is not None:
-            self.context.person_days_remaining -= probabilistic_person_days_this_week
+        current_date = context.current_date
+        person_days_remaining = context.person_days_remaining or 0.0
+        maximum_weekly_days = project.max_person_days_per_week
+        one_week = datetime.timedelta(weeks=1)
+        while True:
+            vacation_days = context.probabilistic_weekly_person_days_lost_to_vacations()
+            holiday_days = project.person_days_lost_to_holidays_this_week(current_date)
+            probabilistic_person_days_this_week = max(
+                maximum_weekly_days - vacation_days - holiday_days, 0
+            )
+            if person_days_remaining <= probabilistic_person_days_this_week:
+                break
+            person_days_remaining -= probabilistic_person_days_this_week
+            if current_date is not None:
+                current_date += one_week
+
+        # It's now days, not weeks
+        context.current_date = current_date
+        context.person_days_remaining = person_days_remaining
+        context.remainder_days = probabilistic_person_days_this_week
+        context.transition_to(states.IterationStateCalculatingDays())
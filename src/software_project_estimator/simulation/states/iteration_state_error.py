@@ -17,6 +17,8 @@ class IterationStateError(states.IterationBaseState):
     The Error state is the state of the iteration when an error has occurred
     """
 
+    __slots__ = ()
+
     def handle_process(self) -> None:
         logger.debug("Iteration has encountered an error.")
         self.context.result = self.context.provisional_result or IterationResult(
@@ -15,39 +15,47 @@ class IterationStateFinalizing(states.IterationBaseState):
     This state is responsible for finalizing the iteration.
     """
 
-    def handle_process(self) -> None:
-        """Finalize the iteration."""
+    __slots__ = ()
 
-        if self.context.project is None:
-            self.context.provisional_result = IterationResult(
+    def handle_process(self) -> None:
+        """
+        Finalize the iteration. Weekends and holidays are skipped in a single
+        loop so that the iteration ends on the next working day.
+        """
+
+        context = self.context
+        project = context.project
+        if project is None:
+            context.provisional_result = IterationResult(
                 status=IterationResultStatus.FAILURE,
                 message="No project was provided.",
             )
-            self.context.transition_to(states.IterationStateError())
+            context.transition_to(states.IterationStateError())
             return
-        if self.context.current_date is None:
-            self.context.provisional_result = IterationResult(
+        current_date = context.current_date
+        if current_date is None:
+            context.provisional_result = IterationResult(
                 status=IterationResultStatus.FAILURE,
                 message="No current date was provided.",
             )
-            self.context.transition_to(states.IterationStateError())
+            context.transition_to(states.IterationStateError())
             return
 
-        if (
-            self.context.current_date.weekday()
-            not in self.context.project.weekly_work_days
-            or self.context.project.is_holiday(self.context.current_date)
+        work_day_mask = project.weekly_work_day_mask
+        one_day = datetime.timedelta(days=1)
+        while not (work_day_mask >> current_date.weekday()) & 1 or project.is_holiday(
+            current_date
         ):
-            self.context.current_date += datetime.timedelta(days=1)
-            return
+            current_date += one_day
+        context.current_date = current_date
 
-        self.context.provisional_result = IterationResult(
+        context.provisional_result = IterationResult(
             status=IterationResultStatus.SUCCESS,
             message="Process completed.",
             attributes={
-                "start_date": self.context.current_date,
-                "end_date": self.context.current_date,
+                "start_date": current_date,
+                "end_date": current_date,
             },
         )
 
-        self.context.transition_to(states.IterationStateSuccessful())
+        context.transition_to(states.IterationStateSuccessful())
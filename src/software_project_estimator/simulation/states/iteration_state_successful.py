@@ -17,6 +17,8 @@ class IterationStateSuccessful(states.IterationBaseState):
     The Successful state is the final state of the iteration.
     """
 
+    __slots__ = ()
+
     def handle_process(self) -> None:
         logger.debug("Iteration was successful.")
         self.context.result = self.context.provisional_result or IterationResult(
@@ -18,6 +18,8 @@ class IterationStateUninitialized(states.IterationBaseState):
     The Uninitialized state is the initial state of the iteration.
     """
 
+    __slots__ = ()
+
     def has_valid_project(self) -> bool:
         """Check if the project is valid."""
         if not self.context.project or not isinstance(self.context.project, Project):
@@ -57,8 +59,11 @@ class IterationStateUninitialized(states.IterationBaseState):
         # Set all initial values. We can ignore the type here because we can't
         # get to this section of code without a project.
         self.context.current_date = self.context.project.start_date  # type: ignore
-        self.context.person_days_remaining = (  # type: ignore
-            self.context.probabilistic_estimated_project_person_days()
-        )
+        estimated_person_days = self.context.estimated_person_days
+        if estimated_person_days is None:
+            estimated_person_days = (
+                self.context.probabilistic_estimated_project_person_days()
+            )
+        self.context.person_days_remaining = estimated_person_days
 
         self.context.transition_to(states.IterationStateCalculatingWeeks())
@@ -2,10 +2,11 @@
 Provides a task data model. A task has a name and various estimates
 """
 
-import math
-from typing import List
+from typing import Iterable, List, Tuple
 from uuid import UUID, uuid4
 
+import numpy
+
 from pydantic import (  # pylint: disable=no-name-in-module # isort: skip
     BaseModel,
     Field,
@@ -38,11 +39,23 @@ class TaskGroup(BaseModel):
 
     def add_task(self, task: "Task") -> bool:
         """Add a task to the group. Return True if the task was added."""
-        if task in self.tasks:
+        # Compare ids rather than whole tasks, which would compare every field.
+        # The tasks list can be changed directly, so it is always scanned
+        # rather than trusting an index that could be out of date.
+        task_id = task.id_
+        if any(existing.id_ == task_id for existing in self.tasks):
             return False
         self.tasks.append(task)
         return True
 
+    def aggregate_stats(self) -> Tuple[float, float]:
+        """
+        Return the sum of the weighted averages and the sum of the variances
+        of the tasks in the group.
+        """
+        averages, stddevs = pert_estimates(self.tasks)
+        return float(averages.sum()), float((stddevs * stddevs).sum())
+
 
 class Task(BaseModel):
     """Data model for our task object"""
@@ -56,7 +69,7 @@ class Task(BaseModel):
     pessimistic: float  # Pessimistic estimate in person days
     likely: float  # Most likely estimate in person days
 
-    @root_validator(pre=True)
+    @root_validator
     def ensure_estimates_are_sane(
         cls, values: dict
     ):  # pylint: disable=no-self-argument
@@ -101,7 +114,26 @@ class Task(BaseModel):
     @property
     def variance(self) -> float:
         """
-        Property representing the variance, which is the square root of the
+        Property representing the variance, which is the square of the
         standard deviation.
         """
-        return math.sqrt(self.stddev)
+        stddev = self.stddev
+        return stddev * stddev
+
+
+def pert_estimates(tasks: Iterable[Task]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Returns the weighted averages and standard deviations of the tasks as two
+    float64 arrays.
+    """
+    # Gather the three estimates into columns so that the weighted averages
+    # and standard deviations are worked out for every task at once rather
+    # than one task at a time.
+    estimates = numpy.array(
+        [(task.optimistic, task.likely, task.pessimistic) for task in tasks],
+        dtype=numpy.float64,
+    ).reshape(-1, 3)
+    optimistic, likely, pessimistic = estimates.T
+    averages = (optimistic + pessimistic + 4 * likely) / 6
+    stddevs = (pessimistic - optimistic) / 6
+    return averages, stddevs
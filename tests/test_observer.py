@@ -58,3 +58,57 @@ class TestObserver(unittest.TestCase):
         observable.register_observer(observer)
         observable.do_something()
         self.assertEqual(observer.event, observable.event)
+
+    def test_notify_observers_by_tag(self):
+        """Test that an observer is only notified of the tags it wants."""
+        observable = MyObservable()
+        observer = MyObserver()
+        observable.register_observer(observer, tags=["something_else"])
+        observable.do_something()
+        self.assertIsNone(observer.event)
+        observable.register_observer(observer, tags=["test"])
+        observable.do_something()
+        self.assertEqual(observer.event, observable.event)
+
+    def test_register_observer_twice(self):
+        """
+        Test that registering an observer again adds to its tags and that one
+        unregister removes it completely.
+        """
+        observable = MyObservable()
+        observer = MyObserver()
+        observable.register_observer(observer, tags=["something_else"])
+        observable.register_observer(observer, tags=["test"])
+        observable.register_observer(observer)
+        observable.register_observer(observer)
+        self.assertEqual(
+            observable._observers, [observer]  # pylint: disable=protected-access
+        )
+        self.assertEqual(
+            observable._subscribers, {}  # pylint: disable=protected-access
+        )
+        observable.unregister_observer(observer)
+        self.assertEqual(
+            len(observable._observers), 0  # pylint: disable=protected-access
+        )
+        self.assertFalse(observable.is_observed("test"))
+        observable.do_something()
+        self.assertIsNone(observer.event)
+
+    def test_is_observed(self):
+        """Test that an observable knows which tags are observed."""
+        observable = MyObservable()
+        self.assertFalse(observable.is_observed("test"))
+        observer = MyObserver()
+        observable.register_observer(observer, tags=["test"])
+        self.assertTrue(observable.is_observed("test"))
+        self.assertFalse(observable.is_observed("something_else"))
+        observable.unregister_observer(observer)
+        self.assertFalse(observable.is_observed("test"))
+
+    def test_events_get_their_own_id(self):
+        """Test that each event gets its own id rather than a shared one."""
+        first = Event(tag="test", data={})
+        second = Event(tag="test", data={})
+        self.assertNotEqual(first.id, second.id)
+        self.assertLessEqual(first.ts, second.ts)
@@ -3,6 +3,7 @@ import unittest
 from datetime import date
 
 from software_project_estimator.project import Project
+from software_project_estimator.task import Task, TaskGroup
 
 
 class TestProjectParameterValidations(unittest.TestCase):
@@ -69,113 +70,120 @@ class TestProjectParameterValidations(unittest.TestCase):
 class TestProject(unittest.TestCase):  # pylint: disable=too-many-public-methods
     """Unit tests for the Project class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build one project with the defaults for the tests that only read it.
+        Tests that change a project build their own.
+        """
+        cls.project = Project(name="Test")
+
     def test_project(self):
         """Test the Project happy path."""
-        project = Project(name="Test")
+        project = self.project
         self.assertEqual(project.name, "Test")
 
     def test_default_date(self):
-        """Test that the date is created with the current date."""
-        project = Project(name="Test")
-        self.assertEqual(project.start_date, date.today())
-
-    def test_default_developer_count(self):
-        """Test that the default developer count is 1."""
-        project = Project(name="Test")
-        self.assertEqual(project.developer_count, 1)
-
-    def test_default_weeks_off_per_year(self):
-        """Test that the default weeks off per year is 2."""
+        """
+        Test that the date is created with the current date. The project is
+        built between two reads of the date so that the test still holds if
+        it runs across midnight.
+        """
+        before = date.today()
         project = Project(name="Test")
-        self.assertEqual(project.weeks_off_per_year, 2.0)
+        after = date.today()
+        self.assertIn(project.start_date, (before, after))
 
-    def test_default_work_days_per_week(self):
-        """Test that the default work days per week is 5."""
-        project = Project(name="Test")
-        self.assertEqual(project.work_days_per_week, 5.0)
+    def test_defaults(self):
+        """Test the default parameters and the properties that follow them."""
+        defaults = {
+            "developer_count": 1,
+            "weeks_off_per_year": 2.0,
+            "work_days_per_week": 5.0,
+            "weekly_work_days": [0, 1, 2, 3, 4],
+            "work_hours_per_day": 8.0,
+            "communication_penalty": 0.5,
+            "tasks": [],
+            "task_groups": [],
+            "work_week_hours": 40.0,  # 5 days * 8 hours
+        }
+        for attribute, expected in defaults.items():
+            with self.subTest(attribute=attribute):
+                self.assertEqual(getattr(self.project, attribute), expected)
 
     def test_custom_work_days_per_week(self):
         """Test that we can set custom work days"""
         project = Project(name="Test", weekly_work_days=[0, 1, 2, 3, 4, 5, 6])
         self.assertEqual(project.work_days_per_week, 7.0)
 
-    def test_default_weekly_work_days(self):
-        """Test the default weekly_work_days property."""
+    def test_weekly_work_day_mask(self):
+        """Test the weekly_work_day_mask property."""
         project = Project(name="Test")
-        self.assertEqual(
-            project.weekly_work_days,
-            [  # pylint: disable=R0801
-                0,
-                1,
-                2,
-                3,
-                4,
-            ],
-        )
-
-    def test_default_work_hours_per_day(self):
-        """Test that the default work hours per day is 8."""
-        project = Project(name="Test")
-        self.assertEqual(project.work_hours_per_day, 8.0)
-
-    def test_default_communication_penalty(self):
-        """Test that the default communication penalty is 0.5."""
-        project = Project(name="Test")
-        self.assertEqual(project.communication_penalty, 0.5)
-
-    def test_default_tasks(self):
-        """Test that the default tasks is an empty list."""
-        project = Project(name="Test")
-        self.assertEqual(project.tasks, [])
-
-    def test_default_task_groups(self):
-        """Test that the default task groups is an empty list."""
-        project = Project(name="Test")
-        self.assertEqual(project.task_groups, [])
-
-    def test_work_week_hours(self):
-        """Test the work_week_hours property."""
-        project = Project(name="Test")
-        self.assertEqual(project.work_week_hours, 40.0)  # 5 days * 8 hours
+        self.assertEqual(project.weekly_work_day_mask, 0b0011111)
+        project.weekly_work_days = [0, 6]
+        self.assertEqual(project.weekly_work_day_mask, 0b1000001)
 
     def test_num_communication_channels(self):
         """Test the num_communication_channels property."""
-        project = Project(name="Test")
-        self.assertEqual(project.num_communication_channels, 0)
-        project.developer_count = 2
-        self.assertEqual(project.num_communication_channels, 1)
-        project.developer_count = 3
-        self.assertEqual(project.num_communication_channels, 3)
-        project.developer_count = 4
-        self.assertEqual(project.num_communication_channels, 6)
-        project.developer_count = 5
-        self.assertEqual(project.num_communication_channels, 10)
-        project.developer_count = 6
-        self.assertEqual(project.num_communication_channels, 15)
+        # Every pair of developers is a channel: n * (n - 1) / 2
+        expected_channels = {1: 0, 2: 1, 3: 3, 4: 6, 5: 10, 6: 15}
+        for developer_count, expected in expected_channels.items():
+            with self.subTest(developer_count=developer_count):
+                project = Project(name="Test", developer_count=developer_count)
+                self.assertEqual(project.num_communication_channels, expected)
 
     def test_max_person_days_per_week(self):
         """Test the max_person_days_per_week property."""
+        expected_days = {
+            # 1 person working 40 hours per week and 8 hours per day
+            # will work 5 days per week
+            1: 5.0,
+            # 2 people each working 40 hours per week and 8 hours per day. They
+            # will each lose .5 hours this week due to communication overhead.
+            # That gives them collectively 79 hours per week to work. That is
+            # 9.875 days per week.
+            2: 9.875,
+            # 3 people each working 40 hours per week and 8 hours per day. They
+            # will lose a total of 3 hours this week due to communication
+            # overhead. That gives them collectively 117 hours per week to
+            # work. That is 14.625 days
+            3: 14.625,
+        }
+        for developer_count, expected in expected_days.items():
+            with self.subTest(developer_count=developer_count):
+                project = Project(name="Test", developer_count=developer_count)
+                self.assertEqual(project.max_person_days_per_week, expected)
+
+    def test_task_estimates(self):
+        """Test the task_estimates method includes grouped and loose tasks."""
         project = Project(name="Test")
-        # 1 person working 40 hours per week and 8 hours per day
-        # will work 5 days per week
-        self.assertEqual(project.max_person_days_per_week, 5.0)
-        project.developer_count = 2
-        # 2 people each working 40 hours per week and 8 hours per day. They will
-        # each lose .5 hours this week due to communication overhead. That gives
-        # them collectively 79 hours per week to work. That is 9.875 days per week.
-        self.assertEqual(project.max_person_days_per_week, 9.875)
-        project.developer_count = 3
-        # 3 people each working 40 hours per week and 8 hours per day. They will
-        # lose a total of 3 hours this week due to communication overhead. That
-        # gives them collectively 117 hours per week to work. That is 14.625 days
-        self.assertEqual(project.max_person_days_per_week, 14.625)
+        task_group = TaskGroup(name="Test")
+        task_group.tasks = [Task(name="Test", optimistic=3, pessimistic=9, likely=6)]
+        project.task_groups = [task_group]
+        project.tasks = [Task(name="Test", optimistic=1, pessimistic=1, likely=1)]
+        averages, stddevs = project.task_estimates()
+        self.assertEqual(averages.tolist(), [6.0, 1.0])
+        self.assertEqual(stddevs.tolist(), [1.0, 0.0])
+
+    def test_task_estimates_without_tasks(self):
+        """Test the task_estimates method on an empty project."""
+        averages, stddevs = self.project.task_estimates()
+        self.assertEqual(len(averages), 0)
+        self.assertEqual(len(stddevs), 0)
 
     def test_is_christmas_a_holiday(self):
         """Test the is_holiday method with some cheer."""
-        project = Project(name="Test")
+        project = self.project
         self.assertTrue(project.is_holiday(date(2023, 12, 25)))
         self.assertFalse(project.is_holiday(date(2023, 12, 26)))
 
+    def test_is_holiday_follows_country_code(self):
+        """Test that changing the country code changes the holidays."""
+        project = Project(name="Test")
+        self.assertTrue(project.is_holiday(date(2023, 7, 4)))
+        project.country_code = "GB"
+        self.assertFalse(project.is_holiday(date(2023, 7, 4)))
+
     def test_person_days_lost_to_holidays_this_week(self):
         """Test the person_days_lost_to_holidays_this_week method."""
         project = Project(name="Test", developer_count=5)
@@ -183,6 +191,29 @@ class TestProject(unittest.TestCase):  # pylint: disable=too-many-public-methods
             project.person_days_lost_to_holidays_this_week(date(2023, 12, 22)), 5
         )
 
+    def test_person_days_lost_to_holidays_across_years(self):
+        """Test a week that spans New Year's Day with a changing team size."""
+        project = Project(name="Test", developer_count=2)
+        self.assertEqual(
+            project.person_days_lost_to_holidays_this_week(date(2023, 12, 27)), 2
+        )
+        project.developer_count = 3
+        self.assertEqual(
+            project.person_days_lost_to_holidays_this_week(date(2023, 12, 27)), 3
+        )
+
+    def test_person_days_lost_to_holidays_follows_country_code(self):
+        """Test that projects in different countries don't share holidays."""
+        project = Project(name="Test", developer_count=2)
+        british_project = Project(name="Test", developer_count=2, country_code="GB")
+        self.assertEqual(
+            project.person_days_lost_to_holidays_this_week(date(2023, 7, 3)), 2
+        )
+        self.assertEqual(
+            british_project.person_days_lost_to_holidays_this_week(date(2023, 7, 3)),
+            0,
+        )
+
     def test_person_days_not_lost_to_holidays_this_week(self):
         """This is the same as the test above but with holidays turned off"""
         project = Project(name="Test", developer_count=5, country_code=None)
@@ -195,29 +226,43 @@ class TestProject(unittest.TestCase):  # pylint: disable=too-many-public-methods
         project = Project(name="Test", developer_count=5)
         self.assertEqual(project.person_days_lost_to_holidays_this_week(None), 0)
 
-    def test_working_days_whis_week(self):
+    def test_working_days_this_week(self):
         """Test the working_days_this_week method."""
-        project = Project(name="Test")
-        self.assertEqual(
-            project.working_days_this_week(date(2020, 1, 1)),
-            [
+        expected_working_days = {
+            # New Year's Day and a weekend
+            date(2020, 1, 1): [
                 date(2020, 1, 2),
                 date(2020, 1, 3),
                 date(2020, 1, 6),
                 date(2020, 1, 7),
             ],
-        )
-        project.start_date = date(2020, 1, 6)
-        self.assertEqual(
-            project.working_days_this_week(date(2020, 1, 6)),
-            [
+            date(2020, 1, 6): [
                 date(2020, 1, 6),
                 date(2020, 1, 7),
                 date(2020, 1, 8),
                 date(2020, 1, 9),
                 date(2020, 1, 10),
             ],
-        )
+        }
+        for start_date, expected in expected_working_days.items():
+            with self.subTest(start_date=start_date):
+                self.assertEqual(
+                    self.project.working_days_this_week(start_date), expected
+                )
+
+    def test_working_day_count_this_week(self):
+        """Test the working_day_count_this_week method."""
+        project = Project(name="Test")
+        for start_date in (date(2020, 1, 1), date(2020, 1, 6), date(2020, 12, 21)):
+            with self.subTest(start_date=start_date):
+                self.assertEqual(
+                    project.working_day_count_this_week(start_date),
+                    len(project.working_days_this_week(start_date)),
+                )
+        project.weekly_work_days = [0, 1, 2]
+        self.assertEqual(project.working_day_count_this_week(date(2020, 1, 1)), 2)
+        project.country_code = None
+        self.assertEqual(project.working_day_count_this_week(date(2020, 1, 1)), 3)
 
     def test_failure_on_stupid_country_code(self):
         """Test that the country code must be a valid ISO 3166-1 alpha-2 code."""
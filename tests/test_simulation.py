@@ -1,22 +1,31 @@
 """Unit tests for the Simulator."""
+import os
 import unittest
 from datetime import date
 from unittest import mock
 
+import numpy
+
 from software_project_estimator.event import Event
 from software_project_estimator.observer import Observer
 from software_project_estimator.project import WEEKS_IN_A_YEAR, Project
+from software_project_estimator.simulation import monte_carlo
 from software_project_estimator.simulation.models import IterationResultStatus
 from software_project_estimator.task import Task, TaskGroup
 
 from software_project_estimator.simulation.iteration import (  # isort: skip
     Iteration,
     IterationBaseState,
+    IterationContext,
 )
 
 from software_project_estimator.simulation.monte_carlo import (  # isort: skip
+    FAILED_ITERATION,
     MonteCarlo,
     MonteCarloOutcome,
+    _init_worker,
+    _process_count,
+    _run_shard,
 )
 
 from software_project_estimator.simulation.states import (  # isort: skip
@@ -24,6 +33,7 @@ from software_project_estimator.simulation.states import (  # isort: skip
     IterationStateCalculatingWeeks,
     IterationStateError,
     IterationStateFinalizing,
+    IterationStateUninitialized,
 )
 
 
@@ -72,37 +82,72 @@ class TestIteration(unittest.TestCase):
 
     def test_probabilistic_weekly_person_days_lost_to_vacations(self):
         """
-        Test the random_weekly_person_days_lost_to_vacations method. Warning:
-        this test is probabilistic and may fail occasionally.
+        Test the probabilistic_weekly_person_days_lost_to_vacations method.
+        The iteration draws from a seeded generator so the test is repeatable.
         """
         project = Project(name="Test", developer_count=1)
 
         project.weeks_off_per_year = 1
-        iteration = Iteration(project)
+        iteration = Iteration(project, rng=numpy.random.default_rng(0))
+        vacations = iteration.context.probabilistic_weekly_person_days_lost_to_vacations
 
-        total_days = 0
-        for _index in range(WEEKS_IN_A_YEAR):
-            total_days += (
-                iteration.context.probabilistic_weekly_person_days_lost_to_vacations()
-            )
-        self.assertTrue(0 <= total_days <= 20)
+        def total_days() -> int:
+            """Total the vacation days lost over a year of weeks."""
+            return sum(vacations() for _index in range(WEEKS_IN_A_YEAR))
+
+        self.assertTrue(0 <= total_days() <= 20)
 
         project.weeks_off_per_year = 0
-        total_days = 0
-        for _index in range(WEEKS_IN_A_YEAR):
-            total_days += (
-                iteration.context.probabilistic_weekly_person_days_lost_to_vacations()
-            )
-        self.assertEqual(total_days, 0)
+        self.assertEqual(total_days(), 0)
 
         # Ensure that test covereage is 100%.
         project.weeks_off_per_year = 26
-        total_days = 0
-        for _index in range(WEEKS_IN_A_YEAR):
-            total_days += (
-                iteration.context.probabilistic_weekly_person_days_lost_to_vacations()
+        self.assertTrue(total_days() > 0)
+
+    def test_probabilistic_weekly_person_days_lost_to_vacations_batch(self):
+        """
+        Test the probabilistic_weekly_person_days_lost_to_vacations_batch
+        method. The iteration draws from a seeded generator so the test is
+        repeatable.
+        """
+        project = Project(name="Test", developer_count=1)
+        iteration = Iteration(project, rng=numpy.random.default_rng(0))
+        batch = (
+            iteration.context.probabilistic_weekly_person_days_lost_to_vacations_batch
+        )
+
+        project.weeks_off_per_year = 1
+        days = batch(WEEKS_IN_A_YEAR)
+        self.assertEqual(len(days), WEEKS_IN_A_YEAR)
+        self.assertTrue(0 <= days.sum() <= 20)
+        self.assertTrue(set(days.tolist()) <= {0, 5})
+
+        project.weeks_off_per_year = 0
+        self.assertEqual(batch(WEEKS_IN_A_YEAR).sum(), 0)
+
+        project.weeks_off_per_year = 26
+        self.assertTrue(batch(WEEKS_IN_A_YEAR).sum() > 0)
+
+    def test_weekly_vacation_draws_follow_project_changes(self):
+        """
+        Ensure that buffered vacation draws are thrown away when the project
+        changes.
+        """
+        project = Project(name="Test", developer_count=1)
+        iteration = Iteration(project)
+        with mock.patch.object(
+            IterationContext,
+            "probabilistic_weekly_person_days_lost_to_vacations_batch",
+            side_effect=[numpy.full(16, 5), numpy.full(16, 10)],
+        ) as batch:
+            vacations = (
+                iteration.context.probabilistic_weekly_person_days_lost_to_vacations
             )
-        self.assertTrue(total_days > 0)
+            self.assertEqual(vacations(), 5)
+            self.assertEqual(vacations(), 5)
+            project.developer_count = 2
+            self.assertEqual(vacations(), 10)
+            self.assertEqual(batch.call_count, 2)
 
     def test_probablistic_estimated_project_person_days_requires_a_project(self):
         """
@@ -116,11 +161,10 @@ class TestIteration(unittest.TestCase):
 
     def test_probabilistic_estimated_project_person_days(self):
         """
-        Test the probabilistic_estimated_project_person_days method.
-        Warning: this test is probabilistic and may fail occasionally.
+        Test the probabilistic_estimated_project_person_days method. The
+        iteration draws from a seeded generator so the test is repeatable.
         """
         project = Project(name="Test", developer_count=1)
-        project.developer_count = 1
 
         project.tasks = [
             Task(name="Test", optimistic=1, pessimistic=3, likely=2),
@@ -132,22 +176,95 @@ class TestIteration(unittest.TestCase):
         ]
         project.task_groups = [task_group]
 
-        iteration = Iteration(project)
+        iteration = Iteration(project, rng=numpy.random.default_rng(0))
 
-        for _index in range(1000):
-            estimated_days = (
-                iteration.context.probabilistic_estimated_project_person_days()
-            )
-            # We should be getting a random number between 3 and 9
-            self.assertTrue(3 <= estimated_days <= 9)
+        estimated_days = [
+            iteration.context.probabilistic_estimated_project_person_days()
+            for _index in range(100)
+        ]
+        # We should be getting random numbers between 3 and 9
+        self.assertGreaterEqual(min(estimated_days), 3)
+        self.assertLessEqual(max(estimated_days), 9)
+
+    def test_probabilistic_estimated_project_person_days_batch(self):
+        """
+        Test the probabilistic_estimated_project_person_days_batch method.
+        The iteration draws from a seeded generator so the test is repeatable.
+        """
+        project = Project(name="Test", developer_count=1)
+        task_group = TaskGroup(name="Test")
+        task_group.tasks = [
+            Task(name="Test", optimistic=1, pessimistic=3, likely=2),
+            Task(name="Test", optimistic=1, pessimistic=3, likely=2),
+        ]
+        project.tasks = [Task(name="Test", optimistic=1, pessimistic=3, likely=2)]
+        project.task_groups = [task_group]
+
+        iteration = Iteration(project, rng=numpy.random.default_rng(0))
+        estimated_days = (
+            iteration.context.probabilistic_estimated_project_person_days_batch(1000)
+        )
+        self.assertEqual(len(estimated_days), 1000)
+        # We should be getting random numbers between 3 and 9
+        self.assertTrue(((3 <= estimated_days) & (estimated_days <= 9)).all())
+
+    def test_probabilistic_estimated_project_person_days_batch_without_project(
+        self,
+    ):
+        """The batch method returns zeros when there's no project."""
+        iteration = Iteration(project=None)
+        estimated_days = (
+            iteration.context.probabilistic_estimated_project_person_days_batch(5)
+        )
+        self.assertEqual(estimated_days.tolist(), [0.0] * 5)
+
+    def test_provided_random_generator(self):
+        """
+        Ensure that an iteration draws from the random generator it is given.
+        """
+        project = Project(name="Test")
+        project.tasks = [Task(name="Test", optimistic=1, pessimistic=3, likely=2)]
+        first = Iteration(project, rng=numpy.random.default_rng(42))
+        second = Iteration(project, rng=numpy.random.default_rng(42))
+        self.assertEqual(
+            first.context.probabilistic_estimated_project_person_days(),
+            second.context.probabilistic_estimated_project_person_days(),
+        )
 
-    @mock.patch(
-        "software_project_estimator.simulation.iteration.IterationContext."
+    @mock.patch.object(Project, "task_estimates")
+    def test_provided_estimate_distribution(self, task_estimates):
+        """
+        An iteration given the estimate distribution doesn't gather it from
+        the project's tasks.
+        """
+        project = Project(name="Test")
+        iteration = Iteration(project, estimate_distribution=(10.0, 0.0))
+        estimated_days = iteration.context.probabilistic_estimated_project_person_days()
+        self.assertEqual(estimated_days, 10.0)
+        task_estimates.assert_not_called()
+
+    @mock.patch.object(IterationContext, "probabilistic_estimated_project_person_days")
+    def test_provided_estimated_person_days(self, draw):
+        """
+        An iteration given its estimate starts from it rather than drawing
+        one.
+        """
+        project = Project(name="Test", weeks_off_per_year=0)
+        project.tasks = [Task(name="Test", optimistic=1, pessimistic=3, likely=2)]
+        iteration = Iteration(project, estimated_person_days=10.0)
+        iteration.context.transition_to(IterationStateUninitialized())
+        iteration.context.process()
+        self.assertEqual(iteration.context.person_days_remaining, 10.0)
+        draw.assert_not_called()
+
+    @mock.patch.object(
+        IterationContext,
         "probabilistic_weekly_person_days_lost_to_vacations",
         return_value=0,
     )
-    @mock.patch(
-        "software_project_estimator.Project.person_days_lost_to_holidays_this_week",
+    @mock.patch.object(
+        Project,
+        "person_days_lost_to_holidays_this_week",
         return_value=0,
     )
     def test_calculating_weeks(self, *args):
@@ -156,7 +273,6 @@ class TestIteration(unittest.TestCase):
         twice before continuing. The mock calls are the best indicator of this.
         """
         project = Project(name="Test", developer_count=1)
-        project.developer_count = 1
         project.start_date = date(2020, 1, 1)
 
         project.tasks = [
@@ -179,6 +295,25 @@ class TestIteration(unittest.TestCase):
             IterationStateError,
         )
 
+    def test_calculating_weeks_in_one_step(self):
+        """
+        Ensure that all of the whole weeks are consumed in a single pass
+        through the IterationStateCalculatingWeeks state.
+        """
+        project = Project(name="Test", country_code=None, weeks_off_per_year=0)
+        iteration = Iteration(project)
+        iteration.context.current_date = date(2020, 1, 1)
+        iteration.context.person_days_remaining = 12
+        iteration.context.transition_to(IterationStateCalculatingWeeks())
+        iteration.context.process()
+        self.assertIsInstance(
+            iteration.context._state,  # pylint: disable=protected-access
+            IterationStateCalculatingDays,
+        )
+        self.assertEqual(iteration.context.current_date, date(2020, 1, 15))
+        self.assertEqual(iteration.context.person_days_remaining, 2)
+        self.assertEqual(iteration.context.remainder_days, 5)
+
     def test_calculating_days_without_project(self):
         """Ensure that we can't calculate days without a project."""
         iteration = Iteration(project=None)
@@ -221,13 +356,28 @@ class TestIteration(unittest.TestCase):
             IterationStateError,
         )
 
-    @mock.patch(
-        "software_project_estimator.simulation.iteration.IterationContext."
+    def test_finalizing_skips_to_the_next_working_day(self):
+        """
+        Ensure that finalizing skips a weekend and a holiday in a single pass.
+        """
+        iteration = Iteration(project=Project(name="Test"))
+        # Saturday before Martin Luther King Jr. Day
+        iteration.context.current_date = date(2020, 1, 18)
+        iteration.context.transition_to(IterationStateFinalizing())
+        iteration.context.process()
+        self.assertEqual(
+            iteration.context.provisional_result.attributes.get("end_date"),
+            date(2020, 1, 21),
+        )
+
+    @mock.patch.object(
+        IterationContext,
         "probabilistic_weekly_person_days_lost_to_vacations",
         return_value=0,
     )
-    @mock.patch(
-        "software_project_estimator.Project.person_days_lost_to_holidays_this_week",
+    @mock.patch.object(
+        Project,
+        "person_days_lost_to_holidays_this_week",
         return_value=0,
     )
     def test_skipping_calculating_weeks(self, *args):
@@ -236,7 +386,6 @@ class TestIteration(unittest.TestCase):
         and went straight to calculating days.
         """
         project = Project(name="Test", developer_count=1)
-        project.developer_count = 1
         project.start_date = date(2020, 1, 1)
 
         project.tasks = [
@@ -276,81 +425,62 @@ class TestIteration(unittest.TestCase):
 
     def test_calculating_days(self):
         """
-        Ensure that we calculate using the IterationStateCalculatingDays state
-        ultiple times before continuing.
+        Ensure that we calculate the end date through the
+        IterationStateCalculatingDays state for teams of different sizes.
         """
-        project = Project(name="Test")
-        project.developer_count = 1
-        project.start_date = date(2020, 1, 1)
-        project.weeks_off_per_year = 0
-
-        project.tasks = [
-            Task(name="Test", optimistic=12, pessimistic=12, likely=12),
-        ]
-
-        iteration = Iteration(project)
-        iteration.run()
-
-        # If we started on 1/1/2020, we should have 12 person days. With
-        # holidays and weekends that should come out to 17 calendar days.
-        # The actual end date would then be the next day after there was any
-        # activity. If we had worked through the 17th that would skip over MLK
-        # day and end on the next day, which is the 21st.
-        expected_end_date = date(2020, 1, 21)
-        self.assertIsNotNone(iteration.result)
-        self.assertIsNotNone(iteration.result.attributes)
-        self.assertIsNotNone(iteration.result.attributes.get("end_date"))
-        self.assertEqual(iteration.result.attributes.get("end_date"), expected_end_date)
-
-    def test_calculating_days_with_multiple_devlopers(self):
-        """Same thing but with multiple developers."""
-        project = Project(name="Test")
-        project.developer_count = 2
-        project.communication_penalty = 0
-        project.start_date = date(2020, 1, 1)
-        project.weeks_off_per_year = 0
-
-        project.tasks = [
-            Task(name="Test", optimistic=12, pessimistic=12, likely=12),
+        cases = [
+            # If we started on 1/1/2020, we should have 12 person days. With
+            # holidays and weekends that should come out to 17 calendar days.
+            # The actual end date would then be the next day after there was
+            # any activity. If we had worked through the 17th that would skip
+            # over MLK day and end on the next day, which is the 21st.
+            (1, 0.5, date(2020, 1, 21)),
+            # With two developers who are not communicating, that should be 6
+            # working calendar days. The actual end date would then be the
+            # next day after that, which is the 10th when we account for New
+            # Year's Day.
+            (2, 0, date(2020, 1, 10)),
+            # With two developers who are communicating, that should be
+            # slightly more than 6 working calendar days. The actual end date
+            # would then be the next working day after that, which is the 13th.
+            (2, 0.5, date(2020, 1, 13)),
         ]
-
-        iteration = Iteration(project)
-        iteration.run()
-
-        # If we started on 1/1/2020, we should have 12 person days. With two
-        # developers who are not communicating, that should be 6 working
-        # calendar days. The actual end date would then be the next day after
-        # that, which is the 10th when we account for New Year's Day.
-        expected_end_date = date(2020, 1, 10)
-        self.assertIsNotNone(iteration.result)
-        self.assertIsNotNone(iteration.result.attributes)
-        self.assertIsNotNone(iteration.result.attributes.get("end_date"))
-        self.assertEqual(iteration.result.attributes.get("end_date"), expected_end_date)
-
-    def test_calculating_days_with_multiple_devlopers_communicating(self):
-        """Same thing but with multiple developers and communication."""
-        project = Project(name="Test")
-        project.developer_count = 2
-        project.communication_penalty = 0.5
-        project.start_date = date(2020, 1, 1)
-        project.weeks_off_per_year = 0
-
-        project.tasks = [
-            Task(name="Test", optimistic=12, pessimistic=12, likely=12),
-        ]
-
-        iteration = Iteration(project)
-        iteration.run()
-
-        # If we started on 1/1/2020, we should have 12 person days. With two
-        # developers who are communicating, that should be slightly more than
-        # 6 working calendar days. The actual end date would then be the next
-        # working day after that, which is the 13th.
-        expected_end_date = date(2020, 1, 13)
-        self.assertIsNotNone(iteration.result)
-        self.assertIsNotNone(iteration.result.attributes)
-        self.assertIsNotNone(iteration.result.attributes.get("end_date"))
-        self.assertEqual(iteration.result.attributes.get("end_date"), expected_end_date)
+        task = Task(name="Test", optimistic=12, pessimistic=12, likely=12)
+        for developer_count, communication_penalty, expected_end_date in cases:
+            with self.subTest(
+                developer_count=developer_count,
+                communication_penalty=communication_penalty,
+            ):
+                project = Project(
+                    name="Test",
+                    developer_count=developer_count,
+                    communication_penalty=communication_penalty,
+                    start_date=date(2020, 1, 1),
+                    weeks_off_per_year=0,
+                    tasks=[task],
+                )
+
+                iteration = Iteration(project)
+                iteration.run()
+
+                self.assertIsNotNone(iteration.result)
+                self.assertIsNotNone(iteration.result.attributes)
+                self.assertEqual(
+                    iteration.result.attributes.get("end_date"), expected_end_date
+                )
+
+
+def _simulation_project(**kwargs) -> Project:
+    """
+    Build the project that the Monte Carlo tests simulate: a single task
+    starting on 1/1/2020. Any other project parameters can be passed in.
+    """
+    return Project(
+        name="Test",
+        start_date=date(2020, 1, 1),
+        tasks=[Task(name="Test", optimistic=5, pessimistic=16, likely=12)],
+        **kwargs,
+    )
 
 
 class TestMonteCarlo(unittest.TestCase):
@@ -358,14 +488,7 @@ class TestMonteCarlo(unittest.TestCase):
 
     def test_monte_carlo(self):
         """Ensure that we can run a Monte Carlo simulation."""
-        project = Project(name="Test")
-        project.developer_count = 1
-        project.start_date = date(2020, 1, 1)
-        project.weeks_off_per_year = 0
-
-        project.tasks = [
-            Task(name="Test", optimistic=5, pessimistic=16, likely=12),
-        ]
+        project = _simulation_project(developer_count=1, weeks_off_per_year=0)
 
         monte = MonteCarlo(project, 1_000)
         results = monte.run()
@@ -379,44 +502,136 @@ class TestMonteCarlo(unittest.TestCase):
             self.assertIsInstance(result, MonteCarloOutcome)
         self.assertEqual(count, 1_000)
 
+    def test_monte_carlo_outcome_str(self):
+        """Ensure that outcomes print the way the README shows them."""
+        outcome = MonteCarloOutcome(total=8, probability=8e-05)
+        self.assertEqual(str(outcome), "total=8 probability=8e-05")
+
     def test_monte_carlo_cumulative_probabilities(self):
         """
         Ensure that the Monte Carlo simulation runs multiple outocmes with
         increasing cumulative probabilities eventually finishing at 100%.
         """
-        project = Project(name="Test")
-        project.developer_count = 1
-        project.start_date = date(2020, 1, 1)
-        project.weeks_off_per_year = 0
-
-        project.tasks = [
-            Task(name="Test", optimistic=5, pessimistic=16, likely=12),
-        ]
+        project = _simulation_project(developer_count=1, weeks_off_per_year=0)
 
         monte = MonteCarlo(project, 100)
         results = monte.run()
-        cumulative_probability = 0.0
-        for result in results.values():
-            self.assertGreater(result.probability, cumulative_probability)
-            cumulative_probability = result.probability
-        self.assertAlmostEqual(cumulative_probability, 1.0)
+        probabilities = numpy.array([result.probability for result in results.values()])
+        numpy.testing.assert_array_less(0.0, numpy.diff(probabilities, prepend=0.0))
+        self.assertAlmostEqual(probabilities[-1], 1.0)
 
     def test_monte_carlo_run_iteration(self):
         """
         Ensure that we can run a single iteration from a Monte Carlo simulation.
         """
+        project = _simulation_project(developer_count=1, weeks_off_per_year=0)
+
+        monte = MonteCarlo(project, 0)
+        result = monte._run_iteration(0)  # pylint: disable=protected-access
+        self.assertAlmostEqual(result.status, IterationResultStatus.SUCCESS)
+
+    def test_monte_carlo_shards(self):
+        """
+        Ensure that the shards cover every iteration with independent seeds.
+        """
+        project = Project(name="Test")
+        monte = MonteCarlo(project, 1_001)
+        shards = monte._shards()  # pylint: disable=protected-access
+        self.assertEqual(sum(size for size, _ in shards), 1_001)
+        self.assertEqual(
+            len({seed.generate_state(4).tobytes() for _, seed in shards}),
+            len(shards),
+        )
+        monte = MonteCarlo(project, 0)
+        self.assertEqual(monte._shards(), [])  # pylint: disable=protected-access
+
+    def test_monte_carlo_run_shard(self):
+        """
+        Ensure that a shard reports each iteration's end date as an ordinal
+        and marks the iterations that failed, including every iteration of a
+        worker that was never given a project.
+        """
+        with mock.patch.object(monte_carlo, "_worker_project", None):
+            end_dates = _run_shard((3, numpy.random.SeedSequence(1)))
+        self.assertEqual(end_dates.tolist(), [FAILED_ITERATION] * 3)
+
         project = Project(name="Test")
-        project.developer_count = 1
         project.start_date = date(2020, 1, 1)
-        project.weeks_off_per_year = 0
+        with mock.patch.multiple(
+            monte_carlo, _worker_project=None, _worker_distribution=None
+        ):
+            _init_worker(project)
+            end_dates = _run_shard((3, numpy.random.SeedSequence(1)))
+        self.assertEqual(end_dates.tolist(), [FAILED_ITERATION] * 3)
 
         project.tasks = [
             Task(name="Test", optimistic=5, pessimistic=16, likely=12),
         ]
+        with mock.patch.multiple(
+            monte_carlo, _worker_project=None, _worker_distribution=None
+        ):
+            _init_worker(project)
+            end_dates = _run_shard((3, numpy.random.SeedSequence(1)))
+        self.assertEqual(len(end_dates), 3)
+        self.assertTrue((end_dates > date(2020, 1, 1).toordinal()).all())
 
-        monte = MonteCarlo(project, 0)
-        result = monte._run_iteration(0)  # pylint: disable=protected-access
-        self.assertAlmostEqual(result.status, IterationResultStatus.SUCCESS)
+    def test_monte_carlo_process_results(self):
+        """
+        Ensure that the end dates are tallied in date order and that failed
+        iterations only count towards the total.
+        """
+        monte = MonteCarlo(Project(name="Test"), 4)
+        first = date(2020, 1, 2).toordinal()
+        results = numpy.array([first + 3, FAILED_ITERATION, first, first])
+        outcomes = monte._process_results(results)  # pylint: disable=protected-access
+        self.assertEqual(list(outcomes), [date(2020, 1, 2), date(2020, 1, 5)])
+        self.assertEqual(outcomes[date(2020, 1, 2)].total, 2)
+        self.assertEqual(outcomes[date(2020, 1, 2)].probability, 0.5)
+        self.assertEqual(outcomes[date(2020, 1, 5)].total, 1)
+        self.assertEqual(outcomes[date(2020, 1, 5)].probability, 0.75)
+
+    def test_monte_carlo_shard_layout(self):
+        """
+        Ensure that the shards only depend on the iteration count and the
+        seed, so a seeded simulation gives the same results on any machine.
+        """
+        monte = MonteCarlo(Project(name="Test"), 1_001, seed=1234)
+        shards = monte._shards()  # pylint: disable=protected-access
+        self.assertEqual([size for size, _ in shards], [91] * 11)
+        expected_seeds = numpy.random.SeedSequence(1234).spawn(11)
+        self.assertEqual(
+            [seed.generate_state(4).tolist() for _, seed in shards],
+            [seed.generate_state(4).tolist() for seed in expected_seeds],
+        )
+
+    @mock.patch.object(os, "sched_getaffinity", return_value={0, 3}, create=True)
+    def test_process_count_follows_cpu_affinity(self, _sched_getaffinity):
+        """
+        Ensure that the simulation only starts a process for each CPU it is
+        allowed to run on.
+        """
+        self.assertEqual(_process_count(), 2)
+
+    def test_monte_carlo_without_project(self):
+        """
+        Ensure that a simulation without a valid project returns no outcomes
+        rather than failing to start its workers.
+        """
+        self.assertEqual(MonteCarlo(None, 10).run(), {})
+        with mock.patch.multiple(
+            monte_carlo, _worker_project=None, _worker_distribution=None
+        ):
+            _init_worker("Not a project")
+            # pylint: disable-next=protected-access
+            self.assertIsNone(monte_carlo._worker_project)
+
+    def test_monte_carlo_seed(self):
+        """Ensure that seeded simulations are reproducible."""
+        project = _simulation_project()
+
+        first = MonteCarlo(project, 200, seed=1234).run()
+        second = MonteCarlo(project, 200, seed=1234).run()
+        self.assertEqual(first, second)
 
     def test_monte_carlo_preflight(self):
         """
@@ -443,12 +658,7 @@ class TestMonteCarlo(unittest.TestCase):
         Ensure that we can run a Monte Carlo simulation with an observer
         receiving events.
         """
-        project = Project(name="Test")
-        project.start_date = date(2020, 1, 1)
-
-        project.tasks = [
-            Task(name="Test", optimistic=5, pessimistic=16, likely=12),
-        ]
+        project = _simulation_project()
 
         monte = MonteCarlo(project, 100)
         observer = MyObserver()
@@ -457,3 +667,24 @@ class TestMonteCarlo(unittest.TestCase):
 
         # 100 iterations + 100 processed + 6 informational messages
         self.assertEqual(len(observer.events), 206)
+
+    def test_monte_carlo_observation_progress_interval(self):
+        """
+        Ensure that observers only receive every progress_interval-th
+        iteration event.
+        """
+        project = _simulation_project()
+
+        monte = MonteCarlo(project, 100, progress_interval=10)
+        observer = MyObserver()
+        monte.register_observer(observer)
+        monte.run()
+
+        # 10 iterations + 100 processed + 6 informational messages
+        self.assertEqual(len(observer.events), 116)
+
+    def test_monte_carlo_progress_interval_sanity(self):
+        """Ensure that the progress interval is a positive number."""
+        project = Project(name="Test")
+        with self.assertRaises(ValueError):
+            MonteCarlo(project, 100, progress_interval=0)
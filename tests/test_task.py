@@ -9,6 +9,11 @@ from software_project_estimator.task import Task, TaskGroup
 class TestTask(unittest.TestCase):
     """Test the Task class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one task shared by the read-only statistics test."""
+        cls.task = Task(name="Test", optimistic=3, pessimistic=10, likely=5)
+
     def test_task(self):
         """Test the Task class happy path."""
         task = Task(name="Test", optimistic=1, pessimistic=3, likely=2)
@@ -26,20 +31,25 @@ class TestTask(unittest.TestCase):
         with self.assertRaises(ValueError):
             Task()
 
-    def test_average(self):
-        """Test the average property."""
-        task = Task(name="Test", optimistic=3, pessimistic=10, likely=5)
-        self.assertEqual(task.average, 5.5)
-
-    def test_stddev(self):
-        """Test the stddev property."""
-        task = Task(name="Test", optimistic=3, pessimistic=10, likely=5)
-        self.assertAlmostEqual(task.stddev, 1.1667, places=4)
-
-    def test_variance(self):
-        """Test the variance property."""
-        task = Task(name="Test", optimistic=3, pessimistic=10, likely=5)
-        self.assertAlmostEqual(task.variance, 1.0801, places=4)
+    def test_estimates_from_strings(self):
+        """
+        Test that string estimates, like those read from a CSV file, are
+        converted before they are checked.
+        """
+        task = Task(name="Test", optimistic="1", pessimistic="3", likely="2.5")
+        self.assertEqual(task.likely, 2.5)
+        with self.assertRaises(ValueError):
+            Task(name="Test", optimistic="1", pessimistic="3", likely="10")
+
+    def test_statistics(self):
+        """Test the average, stddev and variance properties."""
+        for name, expected, places in (
+            ("average", 5.5, 7),
+            ("stddev", 1.1667, 4),
+            ("variance", 1.3611, 4),
+        ):
+            with self.subTest(name=name):
+                self.assertAlmostEqual(getattr(self.task, name), expected, places)
 
     def test_optimistic_is_positive_number_or_zero(self):
         """Test that the optimistic property is a positive number or 0."""
@@ -86,19 +96,25 @@ class TestTaskGroup(unittest.TestCase):
     def test_add_task_list(self):
         """Test the adding a list of tasks."""
         task_group = TaskGroup(name="Test")
-        task_list = []
-        for index in range(30):
-            task_list.append(
-                Task(
-                    name=f"Test {index}",
-                    optimistic=index,
-                    pessimistic=index + 1,
-                    likely=index + 0.5,
-                )
+        task_list = [
+            Task(
+                name=f"Test {index}",
+                optimistic=index,
+                pessimistic=index + 1,
+                likely=index + 0.5,
             )
+            for index in range(30)
+        ]
         task_group.tasks = task_list
 
-        self.assertEqual(task_group.tasks, task_list)
+        self.assertIs(task_group.tasks, task_list)
+        total_average, total_variance = task_group.aggregate_stats()
+        self.assertAlmostEqual(total_average, sum(task.average for task in task_list))
+        self.assertAlmostEqual(total_variance, sum(task.variance for task in task_list))
+
+    def test_aggregate_stats_empty(self):
+        """Test that an empty group has no average or variance."""
+        self.assertEqual(TaskGroup(name="Test").aggregate_stats(), (0.0, 0.0))
 
     def test_add_task(self):
         """Test the add_task method."""
@@ -123,7 +139,33 @@ class TestTaskGroup(unittest.TestCase):
     def test_task_count(self):
         """Test the task_count property."""
         task_group = TaskGroup(name="Test")
-        self.assertEqual(task_group.task_count, 0)
+        before = task_group.task_count
+        task_group.add_task(Task(name="Test", optimistic=1, pessimistic=3, likely=2))
+        self.assertEqual((before, task_group.task_count), (0, 1))
+
+    def test_add_task_after_assigning_tasks(self):
+        """
+        Test that add_task still spots a duplicate after the tasks list has
+        been replaced directly.
+        """
+        task_group = TaskGroup(name="Test")
+        task_group.add_task(Task(name="First", optimistic=1, pessimistic=3, likely=2))
         task = Task(name="Test", optimistic=1, pessimistic=3, likely=2)
-        task_group.add_task(task)
-        self.assertEqual(task_group.task_count, 1)
+        task_group.tasks = [task]
+        self.assertFalse(task_group.add_task(task))
+        self.assertEqual(task_group.tasks, [task])
+
+    def test_add_task_after_changing_tasks_in_place(self):
+        """
+        Test that add_task follows tasks removed from and appended to the
+        tasks list directly.
+        """
+        task_group = TaskGroup(name="Test")
+        first = Task(name="First", optimistic=1, pessimistic=3, likely=2)
+        second = Task(name="Second", optimistic=1, pessimistic=3, likely=2)
+        task_group.add_task(first)
+        task_group.tasks.remove(first)
+        task_group.tasks.append(second)
+        self.assertFalse(task_group.add_task(second))
+        self.assertTrue(task_group.add_task(first))
+        self.assertEqual(task_group.tasks, [second, first])